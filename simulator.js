@@ -286,6 +286,79 @@ class WhiteElephantSimulator {
         return this.validateAndAnalyze();
     }
     
+    // Rebuild a game exported by the Python simulator (white_elephant_replay.json)
+    static fromReplay(replay) {
+        if (!replay || replay.format !== 'white-elephant-replay') {
+            throw new Error('Not a White Elephant replay file');
+        }
+
+        const scenario = replay.scenario;
+        const simulator = new WhiteElephantSimulator({
+            numPlayers: scenario.players.length,
+            numGifts: scenario.gifts.length,
+            lockThreshold: scenario.rules.lockThreshold,
+            gifts: scenario.gifts
+        });
+        simulator.players = scenario.players.slice();
+        simulator.reset();
+
+        replay.events.forEach(event => simulator.applyReplayEvent(event));
+
+        // Same closing rows as runFullSimulation()
+        simulator.captureGameState("Final State", true);
+        simulator.captureGameState("", false);
+
+        return simulator;
+    }
+
+    applyReplayEvent(event) {
+        const [type, playerIndex, giftId, victimIndex] = event;
+        const player = this.players[playerIndex];
+
+        if (type === 'turn') {
+            this.gameLog.push(`=== ${player}'s Turn ===`);
+            this.captureGameState(`${player} Turn`, true);
+        } else if (type === 'final_swap') {
+            this.gameLog.push(`=== ${player}'s Final Swap Turn ===`);
+            this.captureGameState(`${player} Final Swap`, true);
+        } else if (type === 'unwrap') {
+            const gift = this.getGiftById(giftId);
+            this.availableGiftIds = this.availableGiftIds.filter(id => id !== giftId);
+            this.openedGifts.push(gift);
+            this.playerGifts[player] = gift;
+
+            const actionDesc = `${player} unwraps G${giftId}: ${gift.name}`;
+            this.gameLog.push(`  ${actionDesc}`);
+            this.captureGameState(actionDesc, false, giftId);
+        } else if (type === 'steal') {
+            this.executeSteal(player, this.getGiftById(giftId), this.gameLog);
+        } else if (type === 'swap') {
+            const gift = this.getGiftById(giftId);
+            const victim = this.players[victimIndex];
+            const givenGift = this.playerGifts[player];
+
+            // The gift taken counts as stolen
+            gift.steals += 1;
+            if (gift.steals >= this.config.lockThreshold) {
+                gift.locked = true;
+            }
+
+            this.playerGifts[player] = gift;
+            this.playerGifts[victim] = givenGift;
+
+            const given = givenGift ? `G${givenGift.id}` : 'nothing';
+            const actionDesc = `${player} swaps ${given} for G${giftId}: ${gift.name} with ${victim}`;
+            this.gameLog.push(`  ${actionDesc}`);
+            this.captureGameState(actionDesc, false, giftId, { from: victim, to: player });
+
+            if (gift.locked) {
+                this.gameLog.push(`    G${giftId} is now LOCKED (${this.config.lockThreshold} steals)`);
+            }
+        } else {
+            throw new Error(`Unknown replay event: ${type}`);
+        }
+    }
+    
     validateAndAnalyze() {
         // Validation
         const playersWithoutGifts = this.players.filter(p => this.playerGifts[p] === null);
@@ -364,6 +437,11 @@ class UIController {
         this.lowStealChance = document.getElementById('lowStealChance');
         this.generateGiftsBtn = document.getElementById('generateGiftsBtn');
         this.giftsList = document.getElementById('giftsList');
+
+        // Replay elements
+        this.loadReplayBtn = document.getElementById('loadReplayBtn');
+        this.replayFile = document.getElementById('replayFile');
+        this.replayGameSelect = document.getElementById('replayGameSelect');
     }
     
     bindEvents() {
@@ -380,13 +458,21 @@ class UIController {
         this.closeConfigBtn.addEventListener('click', () => this.toggleConfiguration());
         this.generateGiftsBtn.addEventListener('click', () => this.generateRandomGifts());
         this.numPlayers.addEventListener('change', () => this.updateGiftsList());
+
+        // Replay events
+        this.loadReplayBtn.addEventListener('click', () => this.replayFile.click());
+        this.replayFile.addEventListener('change', () => this.loadReplayFile(this.replayFile.files[0]));
+        this.replayGameSelect.addEventListener('change', () => this.loadSelectedGame());
     }
     
     runSimulation() {
         // Recreate simulator with current configuration
         this.simulator = new WhiteElephantSimulator(this.getConfiguration());
 
-        const result = this.simulator.runFullSimulation();
+        this.showResult(this.simulator.runFullSimulation());
+    }
+
+    showResult(result) {
         this.currentStateIndex = 0;
 
         this.updateGameLog(result);
@@ -402,6 +488,81 @@ class UIController {
         this.stats.classList.remove('hidden');
     }
     
+    // Replay loading. A replay file is one line of JSON; a bundle starts with
+    // a header line indexing each game by byte offset, so only the selected
+    // game is read from disk and parsed.
+    async loadReplayFile(file) {
+        if (!file) return;
+
+        try {
+            const headerLine = await this.readFirstLine(file);
+            const header = JSON.parse(headerLine);
+
+            if (header.format === 'white-elephant-replay-bundle') {
+                if (!header.games || header.games.length === 0) {
+                    throw new Error('this bundle contains no games');
+                }
+
+                this.replayBundle = {
+                    file: file,
+                    games: header.games,
+                    bodyStart: new TextEncoder().encode(headerLine).length + 1
+                };
+
+                this.replayGameSelect.innerHTML = '';
+                header.games.forEach((game, index) => {
+                    const option = document.createElement('option');
+                    option.value = index;
+                    option.textContent = `${game.name} (${game.actions} actions, ${game.steals} steals)`;
+                    this.replayGameSelect.appendChild(option);
+                });
+                this.replayGameSelect.classList.remove('hidden');
+
+                await this.loadBundleGame(0);
+            } else {
+                this.replayBundle = null;
+                this.replayGameSelect.classList.add('hidden');
+                this.showReplay(header);
+            }
+        } catch (error) {
+            alert(`Could not load replay: ${error.message}`);
+        }
+
+        // Allow the same file to be chosen again
+        this.replayFile.value = '';
+    }
+
+    async readFirstLine(file) {
+        let end = Math.min(file.size, 65536);
+        let text = await file.slice(0, end).text();
+        while (!text.includes('\n') && end < file.size) {
+            end = Math.min(file.size, end * 2);
+            text = await file.slice(0, end).text();
+        }
+        return text.split('\n')[0];
+    }
+
+    async loadSelectedGame() {
+        try {
+            await this.loadBundleGame(parseInt(this.replayGameSelect.value));
+        } catch (error) {
+            alert(`Could not load replay: ${error.message}`);
+        }
+    }
+
+    async loadBundleGame(index) {
+        const game = this.replayBundle.games[index];
+        const start = this.replayBundle.bodyStart + game.offset;
+        const text = await this.replayBundle.file.slice(start, start + game.length).text();
+        this.showReplay(JSON.parse(text));
+    }
+
+    showReplay(replay) {
+        this.stopAutoPlay();
+        this.simulator = WhiteElephantSimulator.fromReplay(replay);
+        this.showResult(this.simulator.validateAndAnalyze());
+    }
+    
     stepForward() {
         if (this.currentStateIndex < this.simulator.actionStates.length - 1) {
             this.currentStateIndex++;
@@ -564,7 +725,7 @@ class UIController {
                         cell.classList.add('gift-wrapped');
                     } else if (giftState.locked) {
                         cell.classList.add('gift-locked');
-                    } else if (giftState.steals === 2) {
+                    } else if (giftState.steals >= 2) {
                         cell.classList.add('gift-stolen-twice');
                     } else if (giftState.steals === 1) {
                         cell.classList.add('gift-stolen-once');
@@ -756,7 +917,7 @@ class UIController {
                 // Apply styling based on steal count
                 if (gift.locked) {
                     token.classList.add('locked');
-                } else if (gift.steals === 2) {
+                } else if (gift.steals >= 2) {
                     token.classList.add('stolen-twice');
                 } else if (gift.steals === 1) {
                     token.classList.add('stolen-once');
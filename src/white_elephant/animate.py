@@ -0,0 +1,226 @@
+from matplotlib.animation import FFMpegWriter
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.patches import Rectangle
+import argparse
+from pathlib import Path
+
+from .matrix import LEGEND_ITEMS, NUM_GIFTS, cell_color, parse_game_log
+
+
+# Replay layout (data units)
+CELL_WIDTH = 1.8
+CELL_GAP = 0.2  # Keeps each cell's blit region clear of its neighbours
+CELL_HEIGHT = 1.6
+CELL_Y = 1.2
+CAPTION_Y = 3.8
+
+
+class BlitFFMpegWriter(FFMpegWriter):
+    """Pipe-based ffmpeg writer that streams the canvas as it already is.
+
+    FFMpegWriter.grab_frame() calls savefig(), which redraws every artist.
+    The replay blits changed cells onto the Agg canvas itself, so the
+    finished buffer is written straight to ffmpeg's stdin instead.
+    """
+
+    def grab_frame(self, **savefig_kwargs):
+        self._proc.stdin.write(self.fig.canvas.buffer_rgba())
+
+
+def build_replay_figure(num_states, dpi=100):
+    """Lay out the static replay figure and the artists updated per frame.
+
+    Everything that changes between actions is marked animated, so a full
+    draw renders only the static background (title, legend, frame).
+    """
+    fig = Figure(figsize=(NUM_GIFTS * 2.0 + 1, 6), dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0.03, 0.02, 0.94, 0.96])
+
+    ax.set_xlim(-0.5, NUM_GIFTS * (CELL_WIDTH + CELL_GAP) + 0.3)
+    ax.set_ylim(-1.2, 5.4)
+    ax.axis('off')
+
+    # Title
+    ax.text(NUM_GIFTS * (CELL_WIDTH + CELL_GAP) / 2, 4.9, 'White Elephant Game Replay',
+           ha='center', va='center', fontsize=26, fontweight='bold')
+
+    # Action caption and frame counter
+    caption = ax.text(NUM_GIFTS * (CELL_WIDTH + CELL_GAP) / 2, CAPTION_Y, '',
+                     ha='center', va='center', animated=True)
+    counter = ax.text(NUM_GIFTS * (CELL_WIDTH + CELL_GAP), CAPTION_Y - 0.6,
+                     f'0/{num_states}', ha='right', va='center', fontsize=12,
+                     color='gray', animated=True)
+
+    cells = {}
+    for gift_id in range(1, NUM_GIFTS + 1):
+        x = (gift_id - 1) * (CELL_WIDTH + CELL_GAP)
+
+        rect = Rectangle((x, CELL_Y), CELL_WIDTH, CELL_HEIGHT,
+                        facecolor='#d3d3d3', edgecolor='black', linewidth=1,
+                        animated=True)
+        ax.add_patch(rect)
+
+        # Gift number at top, owner in middle, steal count in corner
+        number = ax.text(x + CELL_WIDTH/2, CELL_Y + CELL_HEIGHT*0.8, f'G{gift_id}',
+                        ha='center', va='center', fontsize=18, fontweight='bold',
+                        animated=True)
+        owner = ax.text(x + CELL_WIDTH/2, CELL_Y + CELL_HEIGHT*0.45, '—',
+                       ha='center', va='center', fontsize=16, animated=True)
+        steals = ax.text(x + CELL_WIDTH*0.92, CELL_Y + CELL_HEIGHT*0.08, '',
+                        ha='right', va='bottom', fontsize=12, fontweight='bold',
+                        animated=True)
+
+        cells[gift_id] = {'rect': rect, 'number': number, 'owner': owner, 'steals': steals}
+
+    # Add legend
+    for i, (color, label) in enumerate(LEGEND_ITEMS):
+        x = i * 3.3
+        box = Rectangle((x, -0.7), 0.4, 0.4,
+                       facecolor=color, edgecolor='black', linewidth=1)
+        ax.add_patch(box)
+        ax.text(x + 0.55, -0.5, label, fontsize=12, va='center')
+
+    return {'fig': fig, 'ax': ax, 'caption': caption, 'counter': counter, 'cells': cells}
+
+
+def _pixel_extent(x0, y0, x1, y1, height, pad=3):
+    """Convert a display-space box to the padded, top-origin pixel box
+    that the Agg canvas expects in restore_region()."""
+    return (int(x0) - pad, int(height - y1) - pad, int(x1) + pad + 1, int(height - y0) + pad + 1)
+
+
+def _update_cell(cell, gift_state):
+    """Point one cell's artists at a gift state."""
+    owner = gift_state['owner']
+    steals = gift_state['steals']
+    cell['rect'].set_facecolor(cell_color(gift_state))
+    cell['owner'].set_text(owner.replace('Player ', 'P') if owner else '—')
+    cell['steals'].set_text(f'×{steals}' if steals > 0 else '')
+
+
+def _update_caption(replay, state, frame, num_states):
+    """Show an action description, styled like the matrix row labels."""
+    if state.get('is_turn_start', False):
+        replay['caption'].set(text=state['action'], fontsize=24, fontweight='bold',
+                              fontstyle='normal', color='#2E86AB')
+    else:
+        replay['caption'].set(text=state['action'], fontsize=18, fontweight='normal',
+                              fontstyle='italic', color='black')
+    replay['counter'].set_text(f'{frame}/{num_states}')
+
+
+def write_replay(action_states, output_file, fps=2, dpi=100):
+    """Encode action states as an animation, one frame per action.
+
+    The background is drawn once. Each frame restores and redraws only the
+    cells whose gift changed plus the caption band, then streams the canvas
+    to ffmpeg, so no frame is kept after it is written.
+    """
+    if not BlitFFMpegWriter.isAvailable():
+        raise RuntimeError("ffmpeg is required to export replays; install it and make sure it is on PATH")
+
+    num_states = len(action_states)
+    replay = build_replay_figure(num_states, dpi=dpi)
+    fig, ax, cells = replay['fig'], replay['ax'], replay['cells']
+    canvas = fig.canvas
+
+    writer = BlitFFMpegWriter(fps=fps)
+    with writer.saving(fig, str(output_file), dpi=dpi):
+        # Static background, captured without any animated artists. It spans
+        # the whole figure, so regions are restored in place with xy=(0, 0).
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+        renderer = canvas.get_renderer()
+
+        height = fig.bbox.height
+        cell_extents = {gift_id: _pixel_extent(*cell['rect'].get_window_extent(renderer).extents, height)
+                        for gift_id, cell in cells.items()}
+        (_, band_y0), (_, band_y1) = ax.transData.transform([(0, CAPTION_Y - 0.8), (0, CAPTION_Y + 0.55)])
+        caption_extent = _pixel_extent(0, band_y0, fig.bbox.width, band_y1, height, pad=0)
+
+        previous = None
+        for frame, state in enumerate(action_states, start=1):
+            if previous is None:
+                changed = list(cells)
+            else:
+                changed = [gift_id for gift_id in cells
+                           if state['gifts'][gift_id] != previous['gifts'][gift_id]]
+
+            for gift_id in changed:
+                cell = cells[gift_id]
+                _update_cell(cell, state['gifts'][gift_id])
+                canvas.restore_region(background, bbox=cell_extents[gift_id], xy=(0, 0))
+                for artist in ('rect', 'number', 'owner', 'steals'):
+                    ax.draw_artist(cell[artist])
+
+            _update_caption(replay, state, frame, num_states)
+            canvas.restore_region(background, bbox=caption_extent, xy=(0, 0))
+            ax.draw_artist(replay['caption'])
+            ax.draw_artist(replay['counter'])
+
+            writer.grab_frame()
+            previous = state
+
+    return num_states
+
+
+def create_replay_animation(output_dir=".", game_log_path=None, output_name='white_elephant_replay.mp4',
+                            fps=2, dpi=100):
+    """Create an animated replay (MP4 or GIF) and save to specified directory."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if game_log_path is None:
+        game_log_path = output_path / 'game_log.txt'
+    else:
+        game_log_path = Path(game_log_path)
+
+    with open(game_log_path, 'r') as f:
+        action_states = parse_game_log(f)
+
+    num_frames = write_replay(action_states, output_path / output_name, fps=fps, dpi=dpi)
+    print(f"✓ Replay animation created with {num_frames} frames!")
+    print(f"  Saved to: {output_path / output_name}")
+
+
+def main():
+    """Entry point for the white-elephant-animate command."""
+    parser = argparse.ArgumentParser(
+        description="Export an animated replay of a White Elephant game"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default=".",
+        help="Output directory for generated files (default: current directory)"
+    )
+    parser.add_argument(
+        "--game-log",
+        help="Path to game log file (default: look in output directory)"
+    )
+    parser.add_argument(
+        "--name",
+        default="white_elephant_replay.mp4",
+        help="Output file name; use a .gif extension for an animated GIF "
+             "(default: white_elephant_replay.mp4)"
+    )
+    parser.add_argument(
+        "--fps",
+        type=float,
+        default=2,
+        help="Actions shown per second (default: 2)"
+    )
+    parser.add_argument(
+        "--dpi",
+        type=int,
+        default=100,
+        help="Resolution of each frame (default: 100)"
+    )
+
+    args = parser.parse_args()
+    create_replay_animation(args.output, args.game_log, args.name, args.fps, args.dpi)
+
+
+if __name__ == "__main__":
+    main()
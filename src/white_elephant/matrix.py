@@ -3,21 +3,40 @@ import matplotlib.patches as mpatches
 from matplotlib.patches import FancyBboxPatch, Rectangle
 import numpy as np
 import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from .sources import collect_files
 
-def create_matrix_visualization(output_dir=".", game_log_path=None):
-    """Create matrix visualization and save to specified directory."""
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    if game_log_path is None:
-        game_log_path = output_path / 'game_log.txt'
-    else:
-        game_log_path = Path(game_log_path)
-    
-    # Read action snapshots from the simulation
-    # We'll reconstruct from the game log
+
+# Matrix layout
+NUM_GIFTS = 8
+CELL_HEIGHT = 1.2
+CELL_WIDTH = 2.0
+
+# Fixed figure margins (inches). The left margin fits the longest action
+# label, so the axes geometry never depends on which game is rendered.
+LABEL_MARGIN = 8.5
+RIGHT_MARGIN = 0.5
+TOP_MARGIN = 1.5
+BOTTOM_MARGIN = 1.7
+
+# Legend entries, in display order
+LEGEND_ITEMS = [
+    ('#d3d3d3', 'Wrapped'),
+    ('#95e1d3', 'Opened (0 steals)'),
+    ('#a8dadc', 'Stolen once'),
+    ('#ffd93d', 'Stolen 2+ times'),
+    ('#ff6b6b', 'Locked')
+]
+
+# Per-process cache of figure templates, keyed by number of rows
+_TEMPLATES = {}
+
+
+def parse_game_log(lines):
+    """Rebuild the state after every action from the lines of a game log."""
     action_states = []
 
     # Initial state - all wrapped
@@ -28,50 +47,40 @@ def create_matrix_visualization(output_dir=".", game_log_path=None):
     }
     action_states.append(initial_state)
 
-    # Parse game log to build states
-    with open(game_log_path, 'r') as f:
-        lines = f.readlines()
-
     current_state = {i: {'owner': None, 'steals': 0, 'locked': False} for i in range(1, 9)}
-    gift_names = {
-        'Bluetooth Speaker': 1,
-        'Luxury Candle Set': 2,
-        'Board Game Collection': 3,
-        'Electric Wine Opener': 4,
-        'Cozy Throw Blanket': 5,
-        'Gourmet Coffee Set': 6,
-        'Portable Phone Charger': 7,
-        'Kitchen Gadget Bundle': 8,
-    }
 
     for line in lines:
         line = line.strip()
-        
+
         # Check for turn start
         if '=== Player' in line and 'Turn ===' in line:
             player_num = line.split('Player ')[1].split("'")[0]
+            if 'Final Swap Turn ===' in line:
+                label = f'--- Player {player_num} Final Swap ---'
+            else:
+                label = f'--- Start of Player {player_num} Turn ---'
             action_states.append({
-                'action': f'--- Start of Player {player_num} Turn ---',
+                'action': label,
                 'gifts': {k: v.copy() for k, v in current_state.items()},
                 'is_turn_start': True
             })
             continue
-        
+
         # Check for unwrap
         if 'unwraps Gift #' in line:
             parts = line.split('unwraps Gift #')
             player = parts[0].strip()
             gift_num = int(parts[1].split(':')[0])
             gift_name = parts[1].split(':')[1].strip().split('(')[0].strip()
-            
+
             current_state[gift_num]['owner'] = player
-            
+
             action_states.append({
                 'action': f'{player} unwraps Gift #{gift_num}: {gift_name}',
                 'gifts': {k: v.copy() for k, v in current_state.items()},
                 'is_turn_start': False
             })
-        
+
         # Check for steal
         if 'steals Gift #' in line:
             parts = line.split('steals Gift #')
@@ -79,30 +88,76 @@ def create_matrix_visualization(output_dir=".", game_log_path=None):
             gift_num = int(parts[1].split(':')[0])
             gift_name = parts[1].split(':')[1].strip().split('from')[0].strip()
             victim = parts[1].split('from ')[1].strip()
-            
+
             current_state[gift_num]['owner'] = player
             current_state[gift_num]['steals'] += 1
-            
-            if current_state[gift_num]['steals'] >= 3:
-                current_state[gift_num]['locked'] = True
-            
+
             action_states.append({
                 'action': f'{player} steals Gift #{gift_num}: {gift_name} from {victim}',
                 'gifts': {k: v.copy() for k, v in current_state.items()},
                 'is_turn_start': False
             })
 
-    # Create visualization
-    num_states = len(action_states)
-    num_gifts = 8
+        # Check for final swap (the gift taken counts as stolen)
+        if ' swaps ' in line and ' with ' in line:
+            player, rest = line.split(' swaps ', 1)
+            given, rest = rest.split(' for Gift #', 1)
+            taken, victim = rest.rsplit(' with ', 1)
+            gift_num = int(taken.split(':')[0])
+            gift_name = taken.split(':', 1)[1].strip()
+
+            if given.startswith('Gift #'):
+                current_state[int(given[len('Gift #'):].split(':')[0])]['owner'] = victim
+            current_state[gift_num]['owner'] = player
+            current_state[gift_num]['steals'] += 1
+
+            action_states.append({
+                'action': f'{player} swaps for Gift #{gift_num}: {gift_name} with {victim}',
+                'gifts': {k: v.copy() for k, v in current_state.items()},
+                'is_turn_start': False
+            })
+
+        # Check for lock, which belongs to the steal or swap just recorded.
+        # The log states it explicitly, so any lock threshold is handled.
+        if 'is now LOCKED' in line:
+            gift_num = int(line.split('Gift #')[1].split(' ')[0])
+            current_state[gift_num]['locked'] = True
+            action_states[-1]['gifts'][gift_num]['locked'] = True
+
+    return action_states
+
+
+def cell_color(gift_state):
+    """Return the matrix cell color for a single gift state."""
+    if gift_state['owner'] is None:
+        return '#d3d3d3'  # Gray for wrapped
+    elif gift_state['locked']:
+        return '#ff6b6b'  # Red for locked
+    elif gift_state['steals'] >= 2:
+        return '#ffd93d'  # Yellow for 2+ steals (not yet locked)
+    elif gift_state['steals'] == 1:
+        return '#a8dadc'  # Light blue for 1 steal
+    return '#95e1d3'  # Light green for opened, no steals
+
+
+def build_matrix_template(num_states):
+    """Lay out an empty matrix figure with one row per action state.
+
+    The title, headers, legend and every cell artist are created once here;
+    render_matrix() only updates colors and labels, so a template can be
+    reused for every game with the same number of states.
+    """
+    num_gifts = NUM_GIFTS
+    cell_height = CELL_HEIGHT
+    cell_width = CELL_WIDTH
 
     # Calculate figure dimensions
-    cell_height = 1.2
-    cell_width = 2.0
     fig_height = num_states * cell_height + 4  # Extra space for title and legend
     fig_width = num_gifts * cell_width + 2
 
     fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+    fig.subplots_adjust(left=LABEL_MARGIN / fig_width, right=1 - RIGHT_MARGIN / fig_width,
+                        bottom=BOTTOM_MARGIN / fig_height, top=1 - TOP_MARGIN / fig_height)
 
     # Remove axes
     ax.set_xlim(0, num_gifts * cell_width)
@@ -110,7 +165,7 @@ def create_matrix_visualization(output_dir=".", game_log_path=None):
     ax.axis('off')
 
     # Title
-    ax.text(fig_width/2, fig_height-0.5, 'White Elephant Game Matrix - Round by Round View', 
+    ax.text(fig_width/2, fig_height-0.5, 'White Elephant Game Matrix - Round by Round View',
            ha='center', va='center', fontsize=32, fontweight='bold')
 
     # Column headers (Gift numbers)
@@ -119,78 +174,43 @@ def create_matrix_visualization(output_dir=".", game_log_path=None):
         y = num_states * cell_height + 1
         ax.text(x, y, f'G{i+1}', ha='center', va='center', fontsize=28, fontweight='bold')
 
-    # Fill in the matrix
-    for row, state in enumerate(reversed(action_states)):  # Reverse to have latest at top
+    rows = []
+    for row in range(num_states):
         y = row * cell_height
-        
+
         # Action label on the left
-        action_text = state['action']
-        if state.get('is_turn_start', False):
-            # Make turn starts more prominent
-            action_y = y + cell_height/2
-            ax.text(-0.5, action_y, action_text, ha='right', va='center', 
-                   fontsize=28, fontweight='bold', color='#2E86AB')
-        else:
-            action_y = y + cell_height/2
-            ax.text(-0.5, action_y, action_text, ha='right', va='center', 
-                   fontsize=18, style='italic')
-        
-        # Gift cells
-        for gift_id in range(1, 9):
+        label = ax.text(-0.5, y + cell_height/2, '', ha='right', va='center')
+
+        cells = {}
+        for gift_id in range(1, num_gifts + 1):
             x = (gift_id - 1) * cell_width
-            
-            gift_state = state['gifts'][gift_id]
-            owner = gift_state['owner']
-            steals = gift_state['steals']
-            locked = gift_state['locked']
-            
-            # Determine cell color based on state
-            if owner is None:
-                color = '#d3d3d3'  # Gray for wrapped
-            elif locked:
-                color = '#ff6b6b'  # Red for locked
-            elif steals == 2:
-                color = '#ffd93d'  # Yellow for 2 steals
-            elif steals == 1:
-                color = '#a8dadc'  # Light blue for 1 steal
-            else:
-                color = '#95e1d3'  # Light green for opened, no steals
-            
+
             # Draw cell
-            rect = Rectangle((x, y), cell_width, cell_height, 
-                           facecolor=color, edgecolor='black', linewidth=1)
+            rect = Rectangle((x, y), cell_width, cell_height,
+                           facecolor='#d3d3d3', edgecolor='black', linewidth=1)
             ax.add_patch(rect)
-            
+
             # Gift number at top
-            ax.text(x + cell_width/2, y + cell_height*0.8, f'G{gift_id}', 
+            ax.text(x + cell_width/2, y + cell_height*0.8, f'G{gift_id}',
                    ha='center', va='center', fontsize=18, fontweight='bold')
-            
+
             # Owner in middle
-            if owner:
-                ax.text(x + cell_width/2, y + cell_height/2, owner.replace('Player ', 'P'), 
-                       ha='center', va='center', fontsize=16)
-            else:
-                ax.text(x + cell_width/2, y + cell_height/2, '—', 
-                       ha='center', va='center', fontsize=16)
-            
+            owner = ax.text(x + cell_width/2, y + cell_height/2, '—',
+                           ha='center', va='center', fontsize=16)
+
             # Steal count in corner
-            if steals > 0:
-                ax.text(x + cell_width*0.9, y + cell_height*0.1, f'×{steals}', 
-                       ha='right', va='bottom', fontsize=12, fontweight='bold')
+            steals = ax.text(x + cell_width*0.9, y + cell_height*0.1, '',
+                            ha='right', va='bottom', fontsize=12, fontweight='bold')
 
-    # Add legend
-    legend_items = [
-        ('#d3d3d3', 'Wrapped'),
-        ('#95e1d3', 'Opened (0 steals)'),
-        ('#a8dadc', 'Stolen once'),
-        ('#ffd93d', 'Stolen twice'),
-        ('#ff6b6b', 'Locked (3 steals)')
-    ]
+            cells[gift_id] = {'rect': rect, 'owner': owner, 'steals': steals}
+
+        rows.append({'label': label, 'cells': cells})
 
+    # Add legend
     legend_x = 0
     legend_y = -1.5
     legend_y_pos = legend_y - 0.5
-    for i, (color, label) in enumerate(legend_items):
+    for i, (color, label) in enumerate(LEGEND_ITEMS):
         x = legend_x + i * 4.5
         # Draw colored box
         box = Rectangle((x, legend_y_pos), 0.8, 0.6,
@@ -199,10 +219,130 @@ def create_matrix_visualization(output_dir=".", game_log_path=None):
         # Draw label text at same size as action notes
         ax.text(x + 1.0, legend_y_pos + 0.3, label, fontsize=28, va='center')
 
-    plt.tight_layout(pad=0.5)
-    plt.savefig(output_path / 'white_elephant_matrix.png', dpi=150, bbox_inches='tight')
-    print(f"✓ Matrix visualization created with {num_states} states!")
-    print(f"  Dimensions: {fig_width:.1f} × {fig_height:.1f}")
+    return {
+        'fig': fig,
+        'rows': rows,
+        'fig_width': fig_width,
+        'fig_height': fig_height
+    }
+
+
+def render_matrix(template, action_states, output_file):
+    """Fill a matrix template with one game's action states and save it."""
+    # Reverse to have latest at top
+    for row, state in zip(template['rows'], reversed(action_states)):
+        # Make turn starts more prominent
+        if state.get('is_turn_start', False):
+            row['label'].set(text=state['action'], fontsize=28, fontweight='bold',
+                             fontstyle='normal', color='#2E86AB')
+        else:
+            row['label'].set(text=state['action'], fontsize=18, fontweight='normal',
+                             fontstyle='italic', color='black')
+
+        for gift_id, cell in row['cells'].items():
+            gift_state = state['gifts'][gift_id]
+            owner = gift_state['owner']
+            steals = gift_state['steals']
+
+            cell['rect'].set_facecolor(cell_color(gift_state))
+            cell['owner'].set_text(owner.replace('Player ', 'P') if owner else '—')
+            cell['steals'].set_text(f'×{steals}' if steals > 0 else '')
+
+    template['fig'].savefig(output_file, dpi=150, bbox_inches='tight')
+
+
+def get_matrix_template(num_states):
+    """Return the cached template for num_states rows, building it if needed."""
+    if num_states not in _TEMPLATES:
+        _TEMPLATES[num_states] = build_matrix_template(num_states)
+    return _TEMPLATES[num_states]
+
+
+def create_matrix_visualization(output_dir=".", game_log_path=None):
+    """Create matrix visualization and save to specified directory."""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    if game_log_path is None:
+        game_log_path = output_path / 'game_log.txt'
+    else:
+        game_log_path = Path(game_log_path)
+
+    # Read action snapshots from the simulation
+    # We'll reconstruct from the game log
+    with open(game_log_path, 'r') as f:
+        action_states = parse_game_log(f)
+
+    template = get_matrix_template(len(action_states))
+    render_matrix(template, action_states, output_path / 'white_elephant_matrix.png')
+    print(f"✓ Matrix visualization created with {len(action_states)} states!")
+    print(f"  Dimensions: {template['fig_width']:.1f} × {template['fig_height']:.1f}")
+
+
+def batch_output_name(name):
+    """Map a game log's relative path or archive member to its PNG path.
+
+    Subdirectories are mirrored under the output directory, so
+    game1/game_log.txt becomes game1/game_log_matrix.png.
+    """
+    stem = os.path.splitext(name.replace('\\', '/'))[0]
+    parts = [part for part in stem.split('/') if part not in ('', '.', '..')]
+    return '/'.join(parts) + '_matrix.png'
+
+
+def _init_batch_worker():
+    """Use a non-interactive backend in each worker process."""
+    plt.switch_backend('Agg')
+
+
+def _render_batch_entry(task):
+    """Render one game in a worker, reusing that worker's templates."""
+    action_states, output_file = task
+    render_matrix(get_matrix_template(len(action_states)), action_states, output_file)
+    return output_file
+
+
+def create_matrix_batch(source, output_dir=".", workers=None, pattern='game_log*.txt'):
+    """Render a matrix for every game log in source across a process pool.
+
+    Each log is written under output_dir as <relative path>_matrix.png, e.g.
+    game1/game_log.txt becomes game1/game_log_matrix.png. Files that contain
+    no game actions are skipped, and two logs mapping to the same output
+    file raise ValueError before anything is rendered.
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    tasks = []
+    sources_by_output = {}
+    for name, text in collect_files(source, pattern):
+        action_states = parse_game_log(text.splitlines())
+        if len(action_states) <= 1:
+            print(f"Skipping {name}: no game actions found")
+            continue
+
+        output_name = batch_output_name(name)
+        if output_name in sources_by_output:
+            raise ValueError(f"{sources_by_output[output_name]} and {name} would both be written to {output_name}")
+        sources_by_output[output_name] = name
+
+        output_file = output_path / output_name
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tasks.append((action_states, str(output_file)))
+
+    if not tasks:
+        print("No game logs to render")
+        return
+
+    # Keep each worker busy with a run of games so its templates get reused
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+        for output_file in pool.map(_render_batch_entry, tasks, chunksize=chunksize):
+            print(f"✓ {output_file}")
+
+    print(f"✓ Rendered {len(tasks)} matrix visualizations with {workers} workers!")
 
 
 def main():
@@ -219,10 +359,31 @@ def main():
         "--game-log",
         help="Path to game log file (default: look in output directory)"
     )
-    
+    parser.add_argument(
+        "--batch",
+        metavar="SOURCE",
+        help="Render every game log in a directory, glob pattern or .zip/.tar archive"
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for --batch (default: CPU count)"
+    )
+
+    parser.add_argument(
+        "--pattern",
+        default="game_log*.txt",
+        help="File name pattern to collect from directories and archives for --batch "
+             "(default: game_log*.txt)"
+    )
+
     args = parser.parse_args()
-    create_matrix_visualization(args.output, args.game_log)
+    if args.batch:
+        create_matrix_batch(args.batch, args.output, args.workers, args.pattern)
+    else:
+        create_matrix_visualization(args.output, args.game_log)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
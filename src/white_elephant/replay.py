@@ -0,0 +1,138 @@
+import argparse
+import json
+from pathlib import Path
+
+from .sources import collect_files
+
+
+# Replay file formats read by simulator.js
+REPLAY_FORMAT = "white-elephant-replay"
+BUNDLE_FORMAT = "white-elephant-replay-bundle"
+FORMAT_VERSION = 1
+
+
+def build_replay(players, gifts, events, rules):
+    """Assemble a replay: the scenario plus the list of game events.
+
+    Events are compact lists that reference players by index and gifts by id:
+        ["turn", player]                 start of a player's turn
+        ["final_swap", player]           start of the first player's final swap
+        ["unwrap", player, gift]         player unwraps a gift
+        ["steal", player, gift, victim]  player steals a gift from victim
+        ["swap", player, gift, victim]   player trades their gift for victim's
+    Steal counts and locks are not stored; the viewer derives them from
+    rules["lockThreshold"] exactly as the engine does.
+    """
+    return {
+        "format": REPLAY_FORMAT,
+        "version": FORMAT_VERSION,
+        "scenario": {
+            "players": [p.replace("Player ", "P") for p in players],
+            "gifts": [{"id": g["id"], "name": g["name"], "value": g["value"]}
+                      for g in sorted(gifts, key=lambda g: g["id"])],
+            "rules": rules
+        },
+        "events": events
+    }
+
+
+def _dumps(data):
+    """Serialize without whitespace; ASCII-only so byte and string offsets agree."""
+    return json.dumps(data, separators=(",", ":"))
+
+
+def save_replay(replay, path):
+    """Write a single replay as one line of compact JSON."""
+    with open(path, "w") as f:
+        f.write(_dumps(replay) + "\n")
+
+
+def save_replay_bundle(replays, path):
+    """Write many replays as JSON Lines behind a header index.
+
+    The first line lists every game with its byte offset and length,
+    counted from the start of the second line, so the viewer can slice
+    out and parse one game at a time instead of loading the whole file.
+    replays is an iterable of (name, replay) pairs.
+    """
+    games = []
+    lines = []
+    offset = 0
+
+    for name, replay in replays:
+        line = (_dumps(replay) + "\n").encode("ascii")
+        events = replay["events"]
+        games.append({
+            "name": name,
+            "offset": offset,
+            "length": len(line),
+            "actions": sum(1 for e in events if e[0] not in ("turn", "final_swap")),
+            "steals": sum(1 for e in events if e[0] in ("steal", "swap"))
+        })
+        lines.append(line)
+        offset += len(line)
+
+    header = {"format": BUNDLE_FORMAT, "version": FORMAT_VERSION, "games": games}
+
+    with open(path, "wb") as f:
+        f.write((_dumps(header) + "\n").encode("ascii"))
+        for line in lines:
+            f.write(line)
+
+    return len(games)
+
+
+def create_replay_bundle(source, output_file="white_elephant_replays.jsonl",
+                         pattern="white_elephant_replay.json"):
+    """Bundle every replay file in a directory, glob pattern or archive.
+
+    Files that are not replays are skipped; if none are left, ValueError is
+    raised and no bundle is written.
+    """
+    replays = []
+    for name, text in collect_files(source, pattern):
+        try:
+            replay = json.loads(text)
+        except json.JSONDecodeError:
+            replay = None
+        if not isinstance(replay, dict) or replay.get("format") != REPLAY_FORMAT:
+            print(f"Skipping {name}: not a White Elephant replay")
+            continue
+        replays.append((name, replay))
+
+    if not replays:
+        raise ValueError(f"No White Elephant replays found in {source}")
+
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    count = save_replay_bundle(replays, output_file)
+    print(f"✓ Bundled {count} replays into {output_file}")
+
+
+def main():
+    """Entry point for the white-elephant-bundle command."""
+    parser = argparse.ArgumentParser(
+        description="Bundle White Elephant replays for the web viewer"
+    )
+    parser.add_argument(
+        "source",
+        help="Directory, glob pattern or .zip/.tar archive containing replay files"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="white_elephant_replays.jsonl",
+        help="Bundle file to write (default: white_elephant_replays.jsonl)"
+    )
+    parser.add_argument(
+        "--pattern",
+        default="white_elephant_replay.json",
+        help="File name pattern to collect from directories and archives "
+             "(default: white_elephant_replay.json)"
+    )
+
+    args = parser.parse_args()
+    create_replay_bundle(args.source, args.output, args.pattern)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,26 @@ import argparse
 import os
 from pathlib import Path
 
+from .replay import build_replay, save_replay
+
+
+def run_simulation(output_dir=".", lock_threshold=3, max_steals_per_turn=None,
+                   final_swap=False, random_order=False):
+    """Run the simulation and save outputs to the specified directory.
+
+    Rule variants (see RULES.md):
+        lock_threshold: number of steals after which a gift locks.
+        max_steals_per_turn: steals allowed in one turn's chain before the
+            next player must unwrap (None for no cap).
+        final_swap: after the last turn, the first player may trade their
+            gift for any unlocked gift.
+        random_order: play turns in a shuffled order instead of Player 1-8.
+    """
+    if lock_threshold < 1:
+        raise ValueError(f"lock_threshold must be at least 1, got {lock_threshold}")
+    if max_steals_per_turn is not None and max_steals_per_turn < 0:
+        raise ValueError(f"max_steals_per_turn must not be negative, got {max_steals_per_turn}")
 
-def run_simulation(output_dir="."):
-    """Run the simulation and save outputs to the specified directory."""
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
@@ -30,10 +47,17 @@ def run_simulation(output_dir="."):
     players = [f"Player {i+1}" for i in range(8)]
     player_gifts = {player: None for player in players}
 
+    # Turn order is fixed once per run
+    turn_order = list(range(len(players)))
+    if random_order:
+        random.shuffle(turn_order)
+
     # Game log
     game_log = []
     turn_snapshots = []
     action_snapshots = []  # New: track state after each individual action
+    events = []  # Compact event list for the web viewer replay
+    player_index = {player: i for i, player in enumerate(players)}
 
     def capture_game_state(action_description):
         """Capture the current state of all gifts and players"""
@@ -101,6 +125,26 @@ def run_simulation(output_dir="."):
             return best_available
         return None
 
+    # The steal cap is specialized once per run: uncapped games call
+    # steal_decision directly, capped games go through a wrapper that counts
+    # the steals in the current chain.
+    if max_steals_per_turn is None:
+        decide_steal = steal_decision
+    else:
+        chain_steals = 0
+
+        def decide_steal(current_player, available_gifts, opened_gifts, just_stolen_gift=None):
+            """steal_decision, but once the cap is reached the chain must end with an unwrap"""
+            nonlocal chain_steals
+            if just_stolen_gift is None:
+                chain_steals = 0  # A new chain starts with nothing just stolen
+            if chain_steals >= max_steals_per_turn and available_gifts:
+                return None
+            target = steal_decision(current_player, available_gifts, opened_gifts, just_stolen_gift)
+            if target is not None:
+                chain_steals += 1
+            return target
+
     def execute_turn(player_num, available_gift_ids, opened_gifts):
         """Execute a single player's turn, handling steal chains.
         CRITICAL: The turn-taker must END with a gift. If their gift is stolen during the chain,
@@ -108,6 +152,7 @@ def run_simulation(output_dir="."):
         current_player = players[player_num]
         turn_log = []
         turn_log.append(f"\n=== {current_player}'s Turn ===")
+        events.append(["turn", player_num])
         
         # Capture initial state
         action_snapshots.append(capture_game_state(f"Start of {current_player}'s turn"))
@@ -118,7 +163,7 @@ def run_simulation(output_dir="."):
         
         while chain_active:
             # Decide: steal or pick new?
-            steal_target = steal_decision(active_player, available_gift_ids, opened_gifts, just_stolen_gift)
+            steal_target = decide_steal(active_player, available_gift_ids, opened_gifts, just_stolen_gift)
             
             if steal_target is None:
                 # Pick a new wrapped gift
@@ -128,6 +173,7 @@ def run_simulation(output_dir="."):
                     available_gift_ids.remove(new_gift_id)
                     opened_gifts.append(new_gift)
                     player_gifts[active_player] = new_gift
+                    events.append(["unwrap", player_index[active_player], new_gift_id])
                     action_desc = f"{active_player} unwraps Gift #{new_gift_id}: {new_gift['name']}"
                     turn_log.append(f"  {action_desc}")
                     action_snapshots.append(capture_game_state(action_desc))
@@ -153,12 +199,13 @@ def run_simulation(output_dir="."):
                 if victim:
                     # Update steals count and check for lock
                     steal_target["steals"] += 1
-                    if steal_target["steals"] >= 3:
+                    if steal_target["steals"] >= lock_threshold:
                         steal_target["locked"] = True
                     
                     # Transfer the gift
                     player_gifts[active_player] = steal_target
                     player_gifts[victim] = None
+                    events.append(["steal", player_index[active_player], steal_target["id"], player_index[victim]])
                     
                     action_desc = f"{active_player} steals Gift #{steal_target['id']}: {steal_target['name']} from {victim}"
                     turn_log.append(f"  {action_desc}")
@@ -167,7 +214,7 @@ def run_simulation(output_dir="."):
                     just_stolen_gift = steal_target  # Track this to prevent immediate steal-back
                     
                     if steal_target["locked"]:
-                        turn_log.append(f"    Gift #{steal_target['id']} is now LOCKED (3 steals)")
+                        turn_log.append(f"    Gift #{steal_target['id']} is now LOCKED ({lock_threshold} steals)")
                         chain_active = False  # Chain ends when gift is locked
                     else:
                         # Victim becomes the active player (must steal or pick)
@@ -193,17 +240,60 @@ def run_simulation(output_dir="."):
     available_gift_ids = list(range(1, 9))  # Gift IDs 1-8
     opened_gifts = []
 
+    def execute_final_swap(player_num):
+        """Let a player trade their gift for the best unlocked gift, if it is better.
+        The swap counts as a steal of the gift taken."""
+        current_player = players[player_num]
+        turn_log = [f"\n=== {current_player}'s Final Swap Turn ==="]
+        events.append(["final_swap", player_num])
+        action_snapshots.append(capture_game_state(f"Start of {current_player}'s final swap"))
+
+        own_gift = player_gifts[current_player]
+        own_value = own_gift["value"] if own_gift else 0
+        candidates = [g for g in opened_gifts if not g["locked"] and g is not own_gift and g["value"] > own_value]
+
+        if (own_gift and own_gift["locked"]) or not candidates:
+            turn_log.append(f"  {current_player} keeps current gift")
+        else:
+            swap_target = max(candidates, key=lambda g: g["value"])
+            victim = next(p for p, g in player_gifts.items() if g is swap_target)
+
+            swap_target["steals"] += 1
+            if swap_target["steals"] >= lock_threshold:
+                swap_target["locked"] = True
+
+            player_gifts[current_player] = swap_target
+            player_gifts[victim] = own_gift
+            events.append(["swap", player_index[current_player], swap_target["id"], player_index[victim]])
+
+            own_desc = f"Gift #{own_gift['id']}: {own_gift['name']}" if own_gift else "nothing"
+            action_desc = f"{current_player} swaps {own_desc} for Gift #{swap_target['id']}: {swap_target['name']} with {victim}"
+            turn_log.append(f"  {action_desc}")
+            action_snapshots.append(capture_game_state(action_desc))
+
+            if swap_target["locked"]:
+                turn_log.append(f"    Gift #{swap_target['id']} is now LOCKED ({lock_threshold} steals)")
+
+        game_log.extend(turn_log)
+        return turn_log
+
     # Execute turns
-    for i in range(8):  # 8 players
+    for i in turn_order:
         turn_result = execute_turn(i, available_gift_ids, opened_gifts)
         for line in turn_result:
             print(line)
 
+    # Final swap round for whoever went first
+    if final_swap:
+        for line in execute_final_swap(turn_order[0]):
+            print(line)
+
     # Final state capture
     action_snapshots.append(capture_game_state("Final game state"))
 
-    # Create a snapshot after each player's complete turn
-    for i, player in enumerate(players):
+    # Create a snapshot after each player's complete turn, in turn order
+    for i, player_num in enumerate(turn_order):
+        player = players[player_num]
         gift = player_gifts[player]
         locked_gifts = [g["name"] for g in gifts if g["locked"]]
         opened_gift_names = [g["name"] for g in opened_gifts]
@@ -279,7 +369,7 @@ def run_simulation(output_dir="."):
     # Add steal count as text on bars
     for i, (bar, steals) in enumerate(zip(bars, gift_steals)):
         height = bar.get_height()
-        color = '#e74c3c' if steals >= 3 else '#f39c12' if steals >= 2 else '#27ae60' if steals >= 1 else '#3498db'
+        color = '#e74c3c' if steals >= lock_threshold else '#f39c12' if steals >= 2 else '#27ae60' if steals >= 1 else '#3498db'
         ax1.text(bar.get_x() + bar.get_width()/2., height + 1, f'{steals}×', 
                 ha='center', va='bottom', fontweight='bold', color=color, fontsize=10)
 
@@ -408,7 +498,8 @@ def run_simulation(output_dir="."):
     x_positions = []
     x_pos = 0
 
-    for i, player in enumerate(players):
+    for i, player_num in enumerate(turn_order):
+        player = players[player_num]
         x_positions.append(x_pos)
         
         # Title for this turn
@@ -481,6 +572,16 @@ def run_simulation(output_dir="."):
 
     print("✓ Game log saved!")
 
+    # Save compact replay for the web viewer (index.html)
+    rules = {
+        "lockThreshold": lock_threshold,
+        "maxStealsPerTurn": max_steals_per_turn,
+        "finalSwap": final_swap,
+        "randomOrder": random_order
+    }
+    save_replay(build_replay(players, gifts, events, rules), output_path / 'white_elephant_replay.json')
+    print("✓ Replay saved!")
+
 
 def main():
     """Entry point for the white-elephant-sim command."""
@@ -493,8 +594,36 @@ def main():
         help="Output directory for generated files (default: current directory)"
     )
     
+    parser.add_argument(
+        "--lock-threshold",
+        type=int,
+        default=3,
+        help="Number of steals after which a gift locks (default: 3)"
+    )
+    parser.add_argument(
+        "--max-steals-per-turn",
+        type=int,
+        default=None,
+        help="Steals allowed in one turn's chain before the next player must unwrap (default: no cap)"
+    )
+    parser.add_argument(
+        "--final-swap",
+        action="store_true",
+        help="Give the first player a final swap after the last turn"
+    )
+    parser.add_argument(
+        "--random-order",
+        action="store_true",
+        help="Shuffle the turn order instead of playing Player 1 to 8"
+    )
+    
     args = parser.parse_args()
-    run_simulation(args.output)
+    if args.lock_threshold < 1:
+        parser.error("--lock-threshold must be at least 1")
+    if args.max_steals_per_turn is not None and args.max_steals_per_turn < 0:
+        parser.error("--max-steals-per-turn must not be negative")
+    run_simulation(args.output, args.lock_threshold, args.max_steals_per_turn,
+                   args.final_swap, args.random_order)
 
 
 if __name__ == "__main__":
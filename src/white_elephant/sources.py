@@ -0,0 +1,46 @@
+import fnmatch
+import glob
+import os
+import tarfile
+import zipfile
+from pathlib import Path
+
+
+def collect_files(source, pattern):
+    """Collect (name, text) pairs for every file matching pattern in source.
+
+    source may be a directory (searched recursively for pattern), a glob
+    pattern, or a .zip/.tar archive. Names are relative to the source and
+    the result is sorted by name, so output naming does not depend on
+    filesystem ordering.
+    """
+    source_path = Path(source)
+    files = []
+
+    if source_path.is_dir():
+        for path in source_path.rglob(pattern):
+            if path.is_file():
+                files.append((path.relative_to(source_path).as_posix(), path.read_text()))
+    elif source_path.is_file() and zipfile.is_zipfile(source_path):
+        with zipfile.ZipFile(source_path) as archive:
+            for member in archive.namelist():
+                if not member.endswith('/') and fnmatch.fnmatch(Path(member).name, pattern):
+                    files.append((member, archive.read(member).decode('utf-8')))
+    elif source_path.is_file() and tarfile.is_tarfile(source_path):
+        with tarfile.open(source_path) as archive:
+            for member in archive.getmembers():
+                if member.isfile() and fnmatch.fnmatch(Path(member.name).name, pattern):
+                    text = archive.extractfile(member).read().decode('utf-8')
+                    files.append((member.name, text))
+    else:
+        paths = sorted(Path(p) for p in glob.glob(str(source), recursive=True))
+        paths = [p for p in paths if p.is_file()]
+        if paths:
+            root = Path(os.path.commonpath([str(p.parent) for p in paths]))
+            for path in paths:
+                files.append((path.relative_to(root).as_posix(), path.read_text()))
+
+    if not files:
+        raise FileNotFoundError(f"No files matching {pattern} found in {source}")
+
+    return sorted(files)
@@ -0,0 +1,89 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from white_elephant.animate import (
+    BlitFFMpegWriter,
+    _update_caption,
+    _update_cell,
+    build_replay_figure,
+    write_replay,
+)
+from white_elephant.matrix import parse_game_log
+
+GAME_LOG = """=== Player 1's Turn ===
+  Player 1 unwraps Gift #4: Electric Wine Opener
+=== Player 2's Turn ===
+  Player 2 steals Gift #4: Electric Wine Opener from Player 1
+  Player 1 unwraps Gift #2: Bluetooth Speaker
+=== Player 3's Turn ===
+  Player 3 steals Gift #4: Electric Wine Opener from Player 2
+    Gift #4 is now LOCKED (2 steals)
+  Player 2 steals Gift #2: Bluetooth Speaker from Player 1
+  Player 1 unwraps Gift #7: Portable Phone Charger
+=== Player 1's Final Swap Turn ===
+  Player 1 swaps Gift #7: Portable Phone Charger for Gift #2: Bluetooth Speaker with Player 2
+"""
+
+
+def capture_frames(monkeypatch, action_states, dpi=50):
+    """Run write_replay without ffmpeg, keeping a copy of every frame."""
+    frames = []
+
+    @contextlib.contextmanager
+    def saving(self, fig, outfile, dpi, *args, **kwargs):
+        self.fig = fig
+        yield self
+
+    def grab_frame(self, **savefig_kwargs):
+        frames.append(np.asarray(self.fig.canvas.buffer_rgba()).copy())
+
+    monkeypatch.setattr(BlitFFMpegWriter, "isAvailable", classmethod(lambda cls: True))
+    monkeypatch.setattr(BlitFFMpegWriter, "saving", saving)
+    monkeypatch.setattr(BlitFFMpegWriter, "grab_frame", grab_frame)
+    write_replay(action_states, "unused.mp4", dpi=dpi)
+    return frames
+
+
+def full_redraw(action_states, frame, dpi=50):
+    """Draw one state from scratch, with nothing animated, for comparison."""
+    replay = build_replay_figure(len(action_states), dpi=dpi)
+    state = action_states[frame - 1]
+    for gift_id, cell in replay['cells'].items():
+        _update_cell(cell, state['gifts'][gift_id])
+    _update_caption(replay, state, frame, len(action_states))
+    for artist in replay['ax'].get_children():
+        artist.set_animated(False)
+    replay['fig'].canvas.draw()
+    return np.asarray(replay['fig'].canvas.buffer_rgba()).copy()
+
+
+def test_blitted_frames_match_full_redraw(monkeypatch):
+    action_states = parse_game_log(GAME_LOG.splitlines())
+
+    frames = capture_frames(monkeypatch, action_states)
+
+    assert len(frames) == len(action_states)
+    for frame, image in enumerate(frames, start=1):
+        assert np.array_equal(image, full_redraw(action_states, frame)), f"frame {frame} differs"
+
+
+def test_grab_frame_streams_canvas_buffer():
+    replay = build_replay_figure(1, dpi=50)
+    replay['fig'].canvas.draw()
+    writer = BlitFFMpegWriter()
+    writer.fig = replay['fig']
+    writer._proc = type("Proc", (), {"stdin": io.BytesIO()})()
+
+    writer.grab_frame()
+
+    assert writer._proc.stdin.getvalue() == bytes(replay['fig'].canvas.buffer_rgba())
+
+
+def test_write_replay_requires_ffmpeg(monkeypatch):
+    monkeypatch.setattr(BlitFFMpegWriter, "isAvailable", classmethod(lambda cls: False))
+
+    with pytest.raises(RuntimeError, match="ffmpeg"):
+        write_replay(parse_game_log(GAME_LOG.splitlines()), "unused.mp4")
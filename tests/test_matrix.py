@@ -0,0 +1,118 @@
+import matplotlib.pyplot as plt
+import pytest
+
+from white_elephant.matrix import (
+    batch_output_name,
+    build_matrix_template,
+    create_matrix_batch,
+    parse_game_log,
+    render_matrix,
+)
+
+GAME_LOG = """WHITE ELEPHANT GIFT EXCHANGE - COMPLETE GAME LOG
+
+=== Player 1's Turn ===
+  Player 1 unwraps Gift #4: Electric Wine Opener
+"""
+
+
+# Two-steal lock and a final swap, as logged with --lock-threshold 2 --final-swap
+VARIANT_LOG = """=== Player 1's Turn ===
+  Player 1 unwraps Gift #4: Electric Wine Opener
+=== Player 2's Turn ===
+  Player 2 steals Gift #4: Electric Wine Opener from Player 1
+  Player 1 unwraps Gift #2: Bluetooth Speaker
+=== Player 3's Turn ===
+  Player 3 steals Gift #4: Electric Wine Opener from Player 2
+    Gift #4 is now LOCKED (2 steals)
+  Player 2 unwraps Gift #7: Scented Candle Set
+=== Player 1's Final Swap Turn ===
+  Player 1 swaps Gift #2: Bluetooth Speaker for Gift #7: Scented Candle Set with Player 2
+"""
+
+
+# Same number of rows as GAME_LOG, with a much longer action label
+LONG_LABEL_LOG = """=== Player 8's Turn ===
+  Player 8 unwraps Gift #7: Portable Phone Charger With Extra Long Braided Cable
+"""
+
+
+def write(path, text=GAME_LOG):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_batch_output_name_mirrors_subdirectories():
+    assert batch_output_name("game1/game_log.txt") == "game1/game_log_matrix.png"
+    assert batch_output_name("game_log.txt") == "game_log_matrix.png"
+    assert batch_output_name("./a\\b/game_log.txt") == "a/b/game_log_matrix.png"
+
+
+def test_batch_output_name_stays_inside_output_dir():
+    assert batch_output_name("/abs/game_log.txt") == "abs/game_log_matrix.png"
+    assert batch_output_name("../up/game_log.txt") == "up/game_log_matrix.png"
+
+
+def test_batch_output_name_keeps_nested_and_flat_names_apart():
+    assert batch_output_name("c/game_log.txt") != batch_output_name("c_game_log.txt")
+
+
+def test_batch_rejects_colliding_output_names(tmp_path):
+    source = tmp_path / "logs"
+    write(source / "c" / "game_log.txt")
+    write(source / "c" / "game_log.log")
+
+    with pytest.raises(ValueError, match="c/game_log_matrix.png"):
+        create_matrix_batch(source, tmp_path / "out", workers=1, pattern="game_log*")
+
+
+def test_batch_skips_files_without_game_actions(tmp_path, capsys):
+    source = tmp_path / "logs"
+    write(source / "README.txt", "Just some notes\n")
+
+    create_matrix_batch(source, tmp_path / "out", workers=1, pattern="*.txt")
+
+    assert "Skipping README.txt: no game actions found" in capsys.readouterr().out
+    assert not list((tmp_path / "out").iterdir())
+
+
+def test_batch_render_matches_standalone_render(tmp_path):
+    # One worker renders both logs from the same cached template, in name order
+    source = tmp_path / "logs"
+    write(source / "a" / "game_log.txt", LONG_LABEL_LOG)
+    write(source / "b" / "game_log.txt", GAME_LOG)
+    create_matrix_batch(source, tmp_path / "batch", workers=1)
+
+    template = build_matrix_template(len(parse_game_log(GAME_LOG.splitlines())))
+    render_matrix(template, parse_game_log(GAME_LOG.splitlines()), tmp_path / "standalone.png")
+    plt.close(template['fig'])
+
+    batch = plt.imread(tmp_path / "batch" / "b" / "game_log_matrix.png")
+    standalone = plt.imread(tmp_path / "standalone.png")
+    assert batch.shape == standalone.shape
+    assert (batch == standalone).all()
+
+
+def test_parse_game_log_applies_logged_lock():
+    states = parse_game_log(VARIANT_LOG.splitlines())
+    lock_state = next(s for s in states if s['action'].startswith('Player 3 steals'))
+
+    assert lock_state['gifts'][4] == {'owner': 'Player 3', 'steals': 2, 'locked': True}
+    assert states[-1]['gifts'][4]['locked']
+
+
+def test_parse_game_log_labels_final_swap_turn():
+    states = parse_game_log(VARIANT_LOG.splitlines())
+    headers = [s['action'] for s in states if s['is_turn_start']]
+
+    assert headers[-1] == '--- Player 1 Final Swap ---'
+    assert headers[0] == '--- Start of Player 1 Turn ---'
+
+
+def test_parse_game_log_swap_trades_both_gifts():
+    final = parse_game_log(VARIANT_LOG.splitlines())[-1]
+
+    assert final['action'] == 'Player 1 swaps for Gift #7: Scented Candle Set with Player 2'
+    assert final['gifts'][7] == {'owner': 'Player 1', 'steals': 1, 'locked': False}
+    assert final['gifts'][2]['owner'] == 'Player 2'
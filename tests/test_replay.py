@@ -0,0 +1,80 @@
+import json
+
+import pytest
+
+from white_elephant.replay import (
+    BUNDLE_FORMAT,
+    build_replay,
+    create_replay_bundle,
+    save_replay,
+    save_replay_bundle,
+)
+
+PLAYERS = ["Player 1", "Player 2"]
+GIFTS = [
+    {"id": 2, "name": "Bluetooth Speaker", "value": 40},
+    {"id": 1, "name": "Electric Wine Opener", "value": 25},
+]
+RULES = {"lockThreshold": 3, "maxStealsPerTurn": None, "finalSwap": False, "randomOrder": False}
+
+
+def make_replay(events):
+    return build_replay(PLAYERS, GIFTS, events, RULES)
+
+
+def read_bundle(path):
+    data = path.read_bytes()
+    header_line, body = data.split(b"\n", 1)
+    return json.loads(header_line), body
+
+
+def test_bundle_index_slices_each_replay(tmp_path):
+    replays = [
+        ("a/white_elephant_replay.json", make_replay([["turn", 0], ["unwrap", 0, 1]])),
+        ("b/white_elephant_replay.json", make_replay([
+            ["turn", 0], ["unwrap", 0, 2],
+            ["turn", 1], ["steal", 1, 2, 0], ["unwrap", 0, 1],
+        ])),
+    ]
+    path = tmp_path / "bundle.jsonl"
+
+    assert save_replay_bundle(replays, path) == 2
+
+    header, body = read_bundle(path)
+    assert header["format"] == BUNDLE_FORMAT
+    for game, (name, replay) in zip(header["games"], replays):
+        assert game["name"] == name
+        chunk = body[game["offset"]:game["offset"] + game["length"]]
+        assert json.loads(chunk) == replay
+    assert [(g["actions"], g["steals"]) for g in header["games"]] == [(1, 0), (3, 1)]
+
+
+def test_bundle_skips_invalid_and_foreign_files(tmp_path, capsys):
+    source = tmp_path / "runs"
+    (source / "bad").mkdir(parents=True)
+    (source / "bad" / "white_elephant_replay.json").write_text("{truncated")
+    (source / "other").mkdir()
+    (source / "other" / "white_elephant_replay.json").write_text('{"format": "something-else"}')
+    (source / "good").mkdir()
+    save_replay(make_replay([["turn", 0], ["unwrap", 0, 1]]), source / "good" / "white_elephant_replay.json")
+    output = tmp_path / "bundle.jsonl"
+
+    create_replay_bundle(source, output)
+
+    header, _ = read_bundle(output)
+    assert [g["name"] for g in header["games"]] == ["good/white_elephant_replay.json"]
+    out = capsys.readouterr().out
+    assert "Skipping bad/white_elephant_replay.json" in out
+    assert "Skipping other/white_elephant_replay.json" in out
+
+
+def test_bundle_without_replays_is_not_written(tmp_path):
+    source = tmp_path / "runs"
+    source.mkdir()
+    (source / "white_elephant_replay.json").write_text("{truncated")
+    output = tmp_path / "bundle.jsonl"
+
+    with pytest.raises(ValueError, match="No White Elephant replays"):
+        create_replay_bundle(source, output)
+
+    assert not output.exists()
@@ -0,0 +1,123 @@
+import json
+import random
+
+import matplotlib.pyplot as plt
+import pytest
+
+from white_elephant.matrix import parse_game_log
+from white_elephant.simulation import run_simulation
+
+SEEDS = range(6)
+
+
+@pytest.fixture
+def simulate(tmp_path, monkeypatch, capsys):
+    """Run a seeded game without writing figures; return (events, game log lines)."""
+    monkeypatch.setattr(plt, "savefig", lambda *args, **kwargs: None)
+
+    def run(seed, **rules):
+        output_dir = tmp_path / f"seed{seed}"
+        random.seed(seed)
+        run_simulation(output_dir, **rules)
+        plt.close("all")
+        capsys.readouterr()
+        replay = json.loads((output_dir / "white_elephant_replay.json").read_text())
+        return replay["events"], (output_dir / "game_log.txt").read_text().splitlines()
+
+    return run
+
+
+def turn_order(events):
+    return [e[1] for e in events if e[0] == "turn"]
+
+
+def chain_steals(events):
+    """Steals per turn that happened while wrapped gifts remained."""
+    counts = []
+    unwrapped = 0
+    for event in events:
+        if event[0] == "turn":
+            counts.append(0)
+        elif event[0] == "unwrap":
+            unwrapped += 1
+        elif event[0] == "steal" and unwrapped < 8:
+            counts[-1] += 1
+    return counts
+
+
+def final_owners(log_lines):
+    """Map gift id to owner from the GIFT STATUS section of a game log."""
+    owners = {}
+    for line in log_lines:
+        if line.startswith("Gift #") and "Owner: " in line:
+            gift_id = int(line[len("Gift #"):].split(":")[0])
+            owners[gift_id] = line.split("Owner: ")[1].split(",")[0]
+    return owners
+
+
+@pytest.mark.parametrize("lock_threshold", [0, -1])
+def test_run_simulation_rejects_lock_threshold_below_one(tmp_path, lock_threshold):
+    with pytest.raises(ValueError, match="lock_threshold"):
+        run_simulation(tmp_path, lock_threshold=lock_threshold)
+
+
+def test_run_simulation_rejects_negative_steal_cap(tmp_path):
+    with pytest.raises(ValueError, match="max_steals_per_turn"):
+        run_simulation(tmp_path, max_steals_per_turn=-1)
+
+
+def test_steal_cap_limits_each_chain(simulate):
+    # The seeds do produce chains longer than every cap tested
+    assert max(max(chain_steals(simulate(seed)[0])) for seed in SEEDS) > 2
+
+    for cap in (0, 1, 2):
+        for seed in SEEDS:
+            events, _ = simulate(seed, max_steals_per_turn=cap)
+            assert max(chain_steals(events)) <= cap
+
+
+@pytest.mark.parametrize("lock_threshold", [1, 2, 4])
+def test_gift_locks_on_threshold_steal(simulate, lock_threshold):
+    locks = 0
+    for seed in SEEDS:
+        _, log_lines = simulate(seed, lock_threshold=lock_threshold)
+        for state in parse_game_log(log_lines):
+            for gift in state['gifts'].values():
+                assert gift['steals'] <= lock_threshold
+                assert gift['locked'] == (gift['steals'] == lock_threshold)
+                locks += gift['locked']
+    assert locks > 0
+
+
+def test_final_swap_is_made_by_first_player(simulate):
+    swaps = 0
+    for seed in SEEDS:
+        events, log_lines = simulate(seed, final_swap=True, random_order=True)
+        first = turn_order(events)[0]
+        assert [e for e in events if e[0] == "final_swap"] == [["final_swap", first]]
+
+        if events[-1][0] != "swap":
+            continue
+        swaps += 1
+        _, player, taken, victim = events[-1]
+        assert player == first
+
+        # Ownership just before the final swap, rebuilt from the log's actions
+        header = next(i for i, line in enumerate(log_lines) if "Final Swap Turn" in line)
+        before = parse_game_log(log_lines[:header])[-1]['gifts']
+        given = next((g for g, state in before.items() if state['owner'] == f"Player {first + 1}"), None)
+        owners = final_owners(log_lines)
+
+        assert before[taken]['owner'] == f"Player {victim + 1}"
+        assert owners[taken] == f"Player {first + 1}"
+        if given is not None:
+            assert owners[given] == f"Player {victim + 1}"
+    assert swaps > 0
+
+
+def test_random_order_shuffles_turns(simulate):
+    assert all(turn_order(simulate(seed)[0]) == list(range(8)) for seed in SEEDS)
+
+    orders = [turn_order(simulate(seed, random_order=True)[0]) for seed in SEEDS]
+    assert all(sorted(order) == list(range(8)) for order in orders)
+    assert any(order != list(range(8)) for order in orders)
@@ -0,0 +1,65 @@
+import io
+import tarfile
+import zipfile
+
+import pytest
+
+from white_elephant.sources import collect_files
+
+GAME_LOG = """=== Player 1's Turn ===
+  Player 1 unwraps Gift #4: Electric Wine Opener
+"""
+
+
+def write(path, text=GAME_LOG):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return path
+
+
+def test_collect_files_from_directory_is_sorted(tmp_path):
+    write(tmp_path / "b" / "game_log.txt")
+    write(tmp_path / "a" / "game_log.txt")
+    write(tmp_path / "README.txt", "not a game")
+
+    names = [name for name, _ in collect_files(tmp_path, "game_log*.txt")]
+
+    assert names == ["a/game_log.txt", "b/game_log.txt"]
+
+
+def test_collect_files_from_glob(tmp_path):
+    write(tmp_path / "s1" / "game_log.txt")
+    write(tmp_path / "s2" / "game_log.txt")
+
+    logs = collect_files(str(tmp_path / "*" / "game_log.txt"), "game_log*.txt")
+
+    assert [name for name, _ in logs] == ["s1/game_log.txt", "s2/game_log.txt"]
+    assert logs[0][1] == GAME_LOG
+
+
+def test_collect_files_from_zip(tmp_path):
+    archive = tmp_path / "games.zip"
+    with zipfile.ZipFile(archive, "w") as f:
+        f.writestr("g2/game_log.txt", GAME_LOG)
+        f.writestr("g1/game_log.txt", GAME_LOG)
+        f.writestr("notes.txt", "not a game")
+
+    names = [name for name, _ in collect_files(archive, "game_log*.txt")]
+
+    assert names == ["g1/game_log.txt", "g2/game_log.txt"]
+
+
+def test_collect_files_from_tar(tmp_path):
+    archive = tmp_path / "games.tar"
+    data = GAME_LOG.encode("utf-8")
+    with tarfile.open(archive, "w") as f:
+        info = tarfile.TarInfo("g1/game_log.txt")
+        info.size = len(data)
+        f.addfile(info, io.BytesIO(data))
+
+    assert collect_files(archive, "game_log*.txt") == [("g1/game_log.txt", GAME_LOG)]
+
+
+def test_collect_files_empty_source(tmp_path):
+    with pytest.raises(FileNotFoundError, match="No files matching game_log\\*.txt"):
+        collect_files(tmp_path, "game_log*.txt")